@@ -3,13 +3,15 @@ Payment operations monitoring dashboard.
 Simulates payment traffic, runs the agent loop (observe → reason → decide → guardrail),
 and displays metrics and agent reasoning. Not a chatbot — operations monitoring only.
 """
+import logging
+import sys
 import time
 import streamlit as st
 
-from data_stream.simulator import generate_transaction, aggregate_last_60_seconds
+from data_stream.simulator import generate_transactions, RollingAggregator
 from brain.agent import diagnose_and_decide, get_action_key
 from memory.long_term import get_historical_outcomes, store_lesson
-from guardrails.safety import should_escalate, is_safe
+from guardrails.safety import GuardrailDecision, evaluate
 from tools.routing import reroute_traffic
 from tools.notify import alert_ops
 
@@ -20,8 +22,8 @@ CONFIDENCE_THRESHOLD = 0.8
 
 
 def init_session_state():
-    if "events" not in st.session_state:
-        st.session_state.events = []
+    if "aggregator" not in st.session_state:
+        st.session_state.aggregator = RollingAggregator(window_sec=60)
     if "agent_result" not in st.session_state:
         st.session_state.agent_result = None
     if "action_taken" not in st.session_state:
@@ -29,17 +31,19 @@ def init_session_state():
 
 
 def simulate_traffic(n: int = 25):
-    """Add n simulated transactions to the buffer (recent window used for aggregation)."""
-    for _ in range(n):
-        st.session_state.events.append(generate_transaction())
-    # Keep only last 60 seconds by timestamp
+    """Add n simulated transactions to the rolling 60s aggregate."""
+    aggregator = st.session_state.aggregator
     now = time.time()
-    st.session_state.events = [e for e in st.session_state.events if (now - e.get("ts", 0)) <= 60]
+    for evt in generate_transactions(n, now):
+        aggregator.add(evt)
+    aggregator.expire(now)
 
 
 def get_aggregated():
-    """Observe: aggregate failures and metrics from recent events."""
-    return aggregate_last_60_seconds(st.session_state.events)
+    """Observe: expire old events and read the incrementally maintained aggregate."""
+    aggregator = st.session_state.aggregator
+    aggregator.expire(time.time())
+    return aggregator.snapshot()
 
 
 def run_agent_cycle(aggregated: dict):
@@ -51,7 +55,8 @@ def run_agent_cycle(aggregated: dict):
     action_key = get_action_key(result["proposed_action"])
     confidence = result["confidence_score"]
 
-    if should_escalate(result):
+    decision = evaluate(result, aggregated.get("total_count", 0))
+    if decision is GuardrailDecision.ESCALATE:
         st.session_state.action_taken = "escalated"
         alert_ops(
             f"Confidence {confidence} < {CONFIDENCE_THRESHOLD} — human approval required. "
@@ -64,7 +69,7 @@ def run_agent_cycle(aggregated: dict):
             metadata={"proposed_action": result["proposed_action"], "confidence": confidence},
         )
         return
-    if action_key == "reroute" and is_safe(confidence, len(st.session_state.events)):
+    if action_key == "reroute" and decision is GuardrailDecision.EXECUTE:
         st.session_state.action_taken = "reroute"
         reroute_traffic(percent=30, reason=result.get("diagnosis", "")[:50])
         store_lesson(result["diagnosis"], result["proposed_action"], "EXECUTED", metadata={"action_key": action_key})
@@ -100,9 +105,9 @@ def render_metrics(aggregated: dict):
     if not banks_ordered:
         banks_ordered = list(by_bank.keys())
     if by_bank:
-        import pandas as pd
-        df = pd.DataFrame({"Bank": banks_ordered, "Failures": [by_bank.get(b, 0) for b in banks_ordered]})
-        st.bar_chart(df, x="Bank", y="Failures")
+        # Pass the column dict straight to st.bar_chart instead of building a DataFrame here
+        chart_data = {"Bank": banks_ordered, "Failures": [by_bank.get(b, 0) for b in banks_ordered]}
+        st.bar_chart(chart_data, x="Bank", y="Failures")
     else:
         st.caption("No failures by bank in current window.")
 
@@ -139,31 +144,40 @@ def render_agent_reasoning(result: dict, action_taken: str):
 
 
 def main():
+    # Tool actions and ops alerts are emitted through logging (server console)
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
     st.set_page_config(page_title="Payment operations", page_icon="📊", layout="wide")
     st.title("Payment operations monitoring")
     st.caption("Agentic AI operations dashboard — not a chatbot. Simulate traffic, run agent, view reasoning.")
 
     init_session_state()
 
-    # Sidebar: simulation controls
+    # Sidebar: simulation controls (runs before aggregation, so no extra rerun is needed)
     with st.sidebar:
         st.header("Simulation")
         if st.button("Simulate 25 transactions"):
             simulate_traffic(25)
-            st.rerun()
         if st.button("Simulate 50 transactions"):
             simulate_traffic(50)
-            st.rerun()
-        st.caption(f"Events in buffer: {len(st.session_state.events)}")
 
     aggregated = get_aggregated()
+    st.sidebar.caption(f"Events in buffer: {aggregated.get('total_count', 0)}")
 
     # Metrics
     render_metrics(aggregated)
 
     st.divider()
 
-    # Agent loop
+    agent_panel(aggregated)
+
+
+@st.fragment
+def agent_panel(aggregated: dict):
+    """
+    Agent loop controls and reasoning; "Run agent cycle" reruns only this fragment.
+    Fragment reruns reuse the snapshot main() rendered, so the agent always sees
+    the same numbers as the metrics above it.
+    """
     st.subheader("Agent loop")
     st.caption("Observe (aggregate) → Reason (detect bank-level degradation) → Decide (propose rerouting) → Guardrail (act only if confidence ≥ 0.8)")
 
@@ -172,7 +186,6 @@ def main():
             st.info("Add more transactions (e.g. Simulate 25) then run the agent.")
         else:
             run_agent_cycle(aggregated)
-            st.rerun()
 
     if st.session_state.agent_result is not None:
         render_agent_reasoning(
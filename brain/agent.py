@@ -2,6 +2,9 @@
 Payment operations agent: diagnosis, evidence, proposed action, risk, confidence.
 Produces strict output format; uses rule-based logic (optionally pluggable LLM later).
 """
+from collections import Counter
+from operator import itemgetter
+
 from brain.prompts import (
     DIAGNOSIS_OPTIONS,
     ACTION_OPTIONS,
@@ -26,7 +29,8 @@ def diagnose_and_decide(aggregated: dict, historical: list) -> dict:
     success = aggregated.get("success_count", 0)
     failure = aggregated.get("failure_count", 0)
     success_rate = aggregated.get("success_rate", 0)
-    error_dist = aggregated.get("error_code_distribution", {})
+    # Counter returns 0 for missing codes, so lookups below need no .get default
+    error_dist = Counter(aggregated.get("error_code_distribution", {}))
     failures_by_bank = aggregated.get("failures_by_bank", {})
     failures_by_issuer = aggregated.get("failures_by_issuer", {})
     failures_by_method = aggregated.get("failures_by_method", {})
@@ -48,11 +52,15 @@ def diagnose_and_decide(aggregated: dict, historical: list) -> dict:
             0.4,
         )
 
+    # Healthy window: every rule below needs at least one failure
+    if failure == 0:
+        return _format_output(diagnosis, evidence, proposed_action, risk_assessment, confidence_score)
+
     failure_rate = failure / total if total else 0
-    user_declined = error_dist.get("USER_DECLINED", 0)
-    bank_timeout = error_dist.get("BANK_TIMEOUT", 0)
-    issuer_down = error_dist.get("ISSUER_DOWN", 0)
-    network_error = error_dist.get("NETWORK_ERROR", 0)
+    user_declined = error_dist["USER_DECLINED"]
+    bank_timeout = error_dist["BANK_TIMEOUT"]
+    issuer_down = error_dist["ISSUER_DOWN"]
+    network_error = error_dist["NETWORK_ERROR"]
 
     # User-related: high USER_DECLINED share
     if failure > 0 and user_declined / failure >= 0.5:
@@ -65,12 +73,10 @@ def diagnose_and_decide(aggregated: dict, historical: list) -> dict:
 
     # Bank/issuer degradation: concentrated failures on one bank or issuer
     if failure >= 3:
-        by_bank = failures_by_bank
-        by_issuer = failures_by_issuer
-        top_bank = max(by_bank, key=by_bank.get) if by_bank else None
-        top_issuer = max(by_issuer, key=by_issuer.get) if by_issuer else None
-        pct_bank = by_bank.get(top_bank, 0) / failure if top_bank else 0
-        pct_issuer = by_issuer.get(top_issuer, 0) / failure if top_issuer else 0
+        top_bank, top_bank_count = max(failures_by_bank.items(), key=itemgetter(1)) if failures_by_bank else (None, 0)
+        top_issuer, top_issuer_count = max(failures_by_issuer.items(), key=itemgetter(1)) if failures_by_issuer else (None, 0)
+        pct_bank = top_bank_count / failure
+        pct_issuer = top_issuer_count / failure
 
         if pct_bank >= BANK_CONCENTRATION_THRESHOLD or issuer_down >= failure * 0.4:
             diagnosis = "Bank/issuer degradation"
@@ -112,7 +118,7 @@ def diagnose_and_decide(aggregated: dict, historical: list) -> dict:
     # Anomaly but unclear
     if failure_rate >= FAILURE_SPIKE_THRESHOLD:
         diagnosis = "Possible bank/issuer or network issue; unclear from data"
-        evidence = f"Failure rate {failure_rate:.1%} above threshold; error mix: {error_dist}."
+        evidence = f"Failure rate {failure_rate:.1%} above threshold; error mix: {dict(error_dist)}."
         proposed_action = "Alert human operators"
         risk_assessment = "Uncertain root cause; escalating to avoid wrong intervention."
         confidence_score = 0.65
@@ -146,15 +152,32 @@ def format_agent_output(result: dict) -> str:
     return "\n".join(lines)
 
 
+# Substring fallback for free-form action text, checked in priority order
+_ACTION_KEYWORDS = (
+    ("reroute", "reroute"),
+    ("traffic", "reroute"),
+    ("retry", "retry"),
+    ("suppress", "suppress"),
+    ("failing path", "suppress"),
+    ("alert", "alert"),
+    ("human", "alert"),
+    ("operators", "alert"),
+)
+
+
+def _keyword_action_key(text: str) -> str:
+    for keyword, key in _ACTION_KEYWORDS:
+        if keyword in text:
+            return key
+    return "no_action"
+
+
+# The agent only emits ACTION_OPTIONS, so those resolve with one dict lookup
+_ACTION_KEY_BY_OPTION = {opt.lower(): _keyword_action_key(opt.lower()) for opt in ACTION_OPTIONS}
+
+
 def get_action_key(proposed_action: str) -> str:
     """Map proposed_action text to tool key: reroute, retry, suppress, alert, no_action."""
     a = (proposed_action or "").strip().lower()
-    if "reroute" in a or "traffic" in a:
-        return "reroute"
-    if "retry" in a:
-        return "retry"
-    if "suppress" in a or "failing path" in a:
-        return "suppress"
-    if "alert" in a or "human" in a or "operators" in a:
-        return "alert"
-    return "no_action"
+    key = _ACTION_KEY_BY_OPTION.get(a)
+    return key if key is not None else _keyword_action_key(a)
@@ -1,25 +1,19 @@
-import random
+"""
+Legacy entry point kept for back-compat; wraps the canonical simulator in
+data_stream/simulator.py (events there carry issuer and ts for windowing).
+Events are returned as plain dicts, as this module always did.
+"""
 import time
 
-BANKS = ["HDFC", "ICICI", "SBI"]
-METHODS = ["CARD", "UPI", "NETBANKING"]
-ERRORS = ["SUCCESS", "BANK_TIMEOUT", "ISSUER_DOWN", "USER_DECLINED"]
+from data_stream import simulator
+from data_stream.simulator import BANKS, METHODS, ERROR_CODES
+
+ERRORS = ERROR_CODES
 
-def generate_transaction():
-    bank = random.choice(BANKS)
-    method = random.choice(METHODS)
 
-    if bank == "SBI" and random.random() < 0.4:
-        error = "ISSUER_DOWN"
-    else:
-        error = random.choices(ERRORS, weights=[70, 10, 10, 10])[0]
+def generate_transaction():
+    return simulator.generate_transaction()._asdict()
 
-    return {
-        "bank": bank,
-        "method": method,
-        "status": error,
-        "latency": random.randint(100, 2000)
-    }
 
 def stream_transactions():
     while True:
@@ -4,7 +4,11 @@ and exposes success/failure counts, error distributions, banks/issuers/methods,
 """
 import random
 import time
-from collections import defaultdict
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+import numpy as np
 
 BANKS = ["HDFC", "ICICI", "SBI", "AXIS", "KOTAK"]
 ISSUERS = ["VISA", "MASTERCARD", "RUPAY"]
@@ -12,8 +16,32 @@ METHODS = ["CARD", "UPI", "NETBANKING"]
 ERROR_CODES = ["SUCCESS", "BANK_TIMEOUT", "ISSUER_DOWN", "USER_DECLINED", "NETWORK_ERROR"]
 
 
-def generate_transaction():
-    """Single transaction event."""
+class Txn(NamedTuple):
+    """One payment event; a tuple is smaller than a dict and fields load by offset."""
+    bank: str
+    issuer: str
+    method: str
+    status: str
+    is_failure: bool
+    latency_ms: int
+    ts: float
+
+
+_rng = np.random.default_rng()
+_SBI = BANKS.index("SBI")
+_ISSUER_DOWN = ERROR_CODES.index("ISSUER_DOWN")
+# Per-status probabilities of generate_transaction's chained draws (before the SBI override)
+_STATUS_P = [
+    0.92 * 0.95 * 0.96,  # SUCCESS
+    0.08,                # BANK_TIMEOUT
+    0.0,                 # ISSUER_DOWN (SBI override only)
+    0.92 * 0.95 * 0.04,  # USER_DECLINED
+    0.92 * 0.05,         # NETWORK_ERROR
+]
+
+
+def generate_transaction(now=None):
+    """Single transaction event, stamped with now (defaults to the current time)."""
     bank = random.choice(BANKS)
     issuer = random.choice(ISSUERS)
     method = random.choice(METHODS)
@@ -29,66 +57,102 @@ def generate_transaction():
     else:
         status = "SUCCESS"
 
-    return {
-        "bank": bank,
-        "issuer": issuer,
-        "method": method,
-        "status": status,
-        "latency_ms": random.randint(80, 2500),
-        "ts": time.time(),
-    }
+    return Txn(
+        bank=bank,
+        issuer=issuer,
+        method=method,
+        status=status,
+        is_failure=status != "SUCCESS",
+        latency_ms=random.randint(80, 2500),
+        ts=now if now is not None else time.time(),
+    )
+
+
+def generate_transactions(n: int, now=None):
+    """
+    Batch of n transaction events with the same distribution as generate_transaction(),
+    drawn with a handful of NumPy calls instead of several random calls per event.
+    Every event in the batch is stamped with the same now.
+    """
+    if now is None:
+        now = time.time()
+    bank_ids = _rng.integers(len(BANKS), size=n)
+    issuer_ids = _rng.integers(len(ISSUERS), size=n)
+    method_ids = _rng.integers(len(METHODS), size=n)
+    status_ids = _rng.choice(len(ERROR_CODES), size=n, p=_STATUS_P)
+    status_ids[(bank_ids == _SBI) & (_rng.random(n) < 0.35)] = _ISSUER_DOWN
+    latencies = _rng.integers(80, 2501, size=n)
+    is_failure = status_ids != 0  # ERROR_CODES[0] == "SUCCESS"
+
+    return [
+        Txn(BANKS[b], ISSUERS[i], METHODS[m], ERROR_CODES[s], failed, latency, now)
+        for b, i, m, s, failed, latency in zip(
+            bank_ids.tolist(),
+            issuer_ids.tolist(),
+            method_ids.tolist(),
+            status_ids.tolist(),
+            is_failure.tolist(),
+            latencies.tolist(),
+        )
+    ]
 
 
-def aggregate_last_60_seconds(events):
+def aggregate_last_60_seconds(events, now=None):
     """
     Aggregate events from the last 60 seconds into the format expected by the agent:
     - success_count, failure_count
     - error_code_distribution
     - affected banks, issuers, payment methods
     - average latency
+    Pass now to reuse a timestamp the caller already read.
     """
-    now = time.time()
-    window = [e for e in events if (now - e.get("ts", 0)) <= 60]
-    if not window:
-        return _empty_aggregate()
-
-    success = [e for e in window if e["status"] == "SUCCESS"]
-    failures = [e for e in window if e["status"] != "SUCCESS"]
-
-    error_dist = defaultdict(int)
-    for e in window:
-        error_dist[e["status"]] += 1
-
-    banks = list({e["bank"] for e in window})
-    issuers = list({e["issuer"] for e in window})
-    methods = list({e["method"] for e in window})
+    cutoff = (now if now is not None else time.time()) - 60
+    total = 0
+    success = 0
+    latency_sum = 0
+    error_dist = {}
+    banks, issuers, methods = set(), set(), set()
+    failures_by_bank = {}
+    failures_by_issuer = {}
+    failures_by_method = {}
 
-    failures_by_bank = defaultdict(int)
-    failures_by_issuer = defaultdict(int)
-    failures_by_method = defaultdict(int)
-    for e in failures:
-        failures_by_bank[e["bank"]] += 1
-        failures_by_issuer[e["issuer"]] += 1
-        failures_by_method[e["method"]] += 1
+    # Single pass: window filter and every counter are updated together
+    for e in events:
+        if e.ts < cutoff:
+            continue
+        total += 1
+        status = e.status
+        bank, issuer, method = e.bank, e.issuer, e.method
+        error_dist[status] = error_dist.get(status, 0) + 1
+        banks.add(bank)
+        issuers.add(issuer)
+        methods.add(method)
+        latency_sum += e.latency_ms
+        if e.is_failure:
+            failures_by_bank[bank] = failures_by_bank.get(bank, 0) + 1
+            failures_by_issuer[issuer] = failures_by_issuer.get(issuer, 0) + 1
+            failures_by_method[method] = failures_by_method.get(method, 0) + 1
+        else:
+            success += 1
 
-    latencies = [e["latency_ms"] for e in window]
-    avg_latency = sum(latencies) / len(latencies) if latencies else 0
+    if not total:
+        return _empty_aggregate()
 
     return {
         "window_seconds": 60,
-        "total_count": len(window),
-        "success_count": len(success),
-        "failure_count": len(failures),
-        "success_rate": len(success) / len(window) if window else 0,
-        "error_code_distribution": dict(error_dist),
-        "affected_banks": banks,
-        "affected_issuers": issuers,
-        "affected_methods": methods,
-        "failures_by_bank": dict(failures_by_bank),
-        "failures_by_issuer": dict(failures_by_issuer),
-        "failures_by_method": dict(failures_by_method),
-        "average_latency_ms": round(avg_latency, 2),
-        "sample_size": len(window),
+        "total_count": total,
+        "success_count": success,
+        "failure_count": total - success,
+        "success_rate": success / total,
+        "error_code_distribution": error_dist,
+        "affected_banks": list(banks),
+        "affected_issuers": list(issuers),
+        "affected_methods": list(methods),
+        "failures_by_bank": failures_by_bank,
+        "failures_by_issuer": failures_by_issuer,
+        "failures_by_method": failures_by_method,
+        "average_latency_ms": round(latency_sum / total, 2),
+        "sample_size": total,
     }
 
 
@@ -111,19 +175,134 @@ def _empty_aggregate():
     }
 
 
+@dataclass
+class _Bucket:
+    """Pre-aggregated counters for the events of one wall-clock second."""
+    second: int
+    total: int = 0
+    success: int = 0
+    latency_sum: int = 0
+    error_dist: Counter = field(default_factory=Counter)
+    banks: Counter = field(default_factory=Counter)
+    issuers: Counter = field(default_factory=Counter)
+    methods: Counter = field(default_factory=Counter)
+    failures_by_bank: Counter = field(default_factory=Counter)
+    failures_by_issuer: Counter = field(default_factory=Counter)
+    failures_by_method: Counter = field(default_factory=Counter)
+
+
+class RollingAggregator:
+    """
+    Rolling 60-second aggregate kept as 1-second buckets plus running totals.
+    New events bump the current second's bucket and the totals, expiry drops
+    whole buckets from the left and subtracts them from the totals, and
+    snapshot() only copies the totals. The window edge is accurate to one second.
+    """
+
+    def __init__(self, window_sec=60):
+        self.window_sec = window_sec
+        self.buckets = deque()
+        self.totals = _Bucket(0)
+
+    def __len__(self):
+        return self.totals.total
+
+    def add(self, evt: Txn):
+        _count(self._bucket_for(int(evt.ts)), evt)
+        _count(self.totals, evt)
+
+    def _bucket_for(self, second):
+        buckets = self.buckets
+        if buckets and buckets[-1].second == second:
+            return buckets[-1]
+        if not buckets or buckets[-1].second < second:
+            buckets.append(_Bucket(second))
+            return buckets[-1]
+        # Late event: find (or insert) its bucket, keeping seconds ordered
+        for i in range(len(buckets) - 1, -1, -1):
+            if buckets[i].second == second:
+                return buckets[i]
+            if buckets[i].second < second:
+                buckets.insert(i + 1, _Bucket(second))
+                return buckets[i + 1]
+        buckets.appendleft(_Bucket(second))
+        return buckets[0]
+
+    def expire(self, now=None):
+        """Drop buckets whose whole second lies before the window."""
+        cutoff = (now if now is not None else time.time()) - self.window_sec
+        buckets = self.buckets
+        totals = self.totals
+        while buckets and buckets[0].second + 1 <= cutoff:
+            b = buckets.popleft()
+            totals.total -= b.total
+            totals.success -= b.success
+            totals.latency_sum -= b.latency_sum
+            # Counter -= drops keys whose count reaches zero
+            totals.error_dist -= b.error_dist
+            totals.banks -= b.banks
+            totals.issuers -= b.issuers
+            totals.methods -= b.methods
+            totals.failures_by_bank -= b.failures_by_bank
+            totals.failures_by_issuer -= b.failures_by_issuer
+            totals.failures_by_method -= b.failures_by_method
+
+    def snapshot(self):
+        """Aggregated dict in the same format as aggregate_last_60_seconds."""
+        t = self.totals
+        total = t.total
+        if not total:
+            return _empty_aggregate()
+        return {
+            "window_seconds": self.window_sec,
+            "total_count": total,
+            "success_count": t.success,
+            "failure_count": total - t.success,
+            "success_rate": t.success / total,
+            "error_code_distribution": dict(t.error_dist),
+            "affected_banks": list(t.banks),
+            "affected_issuers": list(t.issuers),
+            "affected_methods": list(t.methods),
+            "failures_by_bank": dict(t.failures_by_bank),
+            "failures_by_issuer": dict(t.failures_by_issuer),
+            "failures_by_method": dict(t.failures_by_method),
+            "average_latency_ms": round(t.latency_sum / total, 2),
+            "sample_size": total,
+        }
+
+
+def _count(bucket, evt):
+    """Add one event to a bucket's counters."""
+    bank, issuer, method = evt.bank, evt.issuer, evt.method
+    bucket.total += 1
+    bucket.latency_sum += evt.latency_ms
+    bucket.error_dist[evt.status] += 1
+    bucket.banks[bank] += 1
+    bucket.issuers[issuer] += 1
+    bucket.methods[method] += 1
+    if evt.is_failure:
+        bucket.failures_by_bank[bank] += 1
+        bucket.failures_by_issuer[issuer] += 1
+        bucket.failures_by_method[method] += 1
+    else:
+        bucket.success += 1
+
+
 def stream_aggregated(window_sec=60, tick_sec=5):
     """
     Simulate continuous stream: collect events for window_sec, then yield
     one aggregated snapshot every tick_sec. For demo, tick_sec can be 2–5.
     """
-    buffer = []
+    buffer = deque()
     last_emit = time.time()
     while True:
-        buffer.append(generate_transaction())
-        # Keep only last 60s
-        cutoff = time.time() - window_sec
-        buffer = [e for e in buffer if e.get("ts", 0) >= cutoff]
-        if time.time() - last_emit >= tick_sec:
-            yield aggregate_last_60_seconds(buffer)
-            last_emit = time.time()
+        now = time.time()
+        buffer.append(generate_transaction(now))
+        # Keep only last 60s; events are appended in ts order, so expire from the left
+        cutoff = now - window_sec
+        while buffer and buffer[0].ts < cutoff:
+            buffer.popleft()
+        if now - last_emit >= tick_sec:
+            yield aggregate_last_60_seconds(buffer, now)
+            last_emit = now
         time.sleep(0.15)
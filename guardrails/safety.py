@@ -1,5 +1,14 @@
+from enum import IntEnum
+
 from config import CONFIDENCE_THRESHOLD, MAX_AUTONOMOUS_VOLUME
 
+
+class GuardrailDecision(IntEnum):
+    EXECUTE = 0     # safe to act autonomously
+    ESCALATE = 1    # human approval required
+    SKIP = 2        # confident, but volume is above the autonomous limit
+
+
 def is_safe(confidence: float, volume: float = 0) -> bool:
     """
     If confidence is below threshold, require human approval.
@@ -17,3 +26,14 @@ def should_escalate(agent_result: dict) -> bool:
     return agent_result.get("recommend_human_approval", True) or (
         agent_result.get("confidence_score", 0) < CONFIDENCE_THRESHOLD
     )
+
+
+def evaluate(agent_result: dict, volume: float = 0) -> GuardrailDecision:
+    """Single guardrail check combining should_escalate and is_safe."""
+    if agent_result.get("recommend_human_approval", True) or (
+        agent_result.get("confidence_score", 0) < CONFIDENCE_THRESHOLD
+    ):
+        return GuardrailDecision.ESCALATE
+    if volume > MAX_AUTONOMOUS_VOLUME:
+        return GuardrailDecision.SKIP
+    return GuardrailDecision.EXECUTE
@@ -2,31 +2,53 @@
 Payment operations agent runtime.
 Continuously observes 60s aggregated payment signals, reasons about root cause,
 decides one safe action, and learns from outcomes. Escalates when confidence < 0.8.
+Lesson writes and ops alerts run in worker threads so they overlap the next cycle.
 """
+import asyncio
+import logging
+import sys
 import time
-from data_stream.simulator import generate_transaction, aggregate_last_60_seconds
+from data_stream.simulator import generate_transaction, RollingAggregator
 from brain.agent import diagnose_and_decide, format_agent_output, get_action_key
 from memory.long_term import get_historical_outcomes, store_lesson
 from memory.short_term import remember
-from guardrails.safety import is_safe, should_escalate
+from guardrails.safety import GuardrailDecision, evaluate
 from tools.routing import reroute_traffic, suppress_failing_path
 from tools.retry import adjust_retry_policy
 from tools.notify import alert_ops
 from config import MAX_AUTONOMOUS_VOLUME
 
-# Event buffer for last 60 seconds
-_event_buffer = []
+log = logging.getLogger(__name__)
+
 AGGREGATION_WINDOW_SEC = 60
+# Rolling aggregate over the last 60 seconds
+_aggregator = RollingAggregator(window_sec=AGGREGATION_WINDOW_SEC)
 TICK_SEC = 5   # for demo: run agent every 5s; use 60 in production
+# Strong references to in-flight background tasks (asyncio only keeps weak ones)
+_background_tasks = set()
+
+
+def collect_and_aggregate(now=None):
+    """Expire events outside the window and return aggregated snapshot."""
+    _aggregator.expire(now if now is not None else time.time())
+    return _aggregator.snapshot()
+
+
+def _fire_and_forget(func, *args, **kwargs):
+    """Run blocking I/O (lesson append, alert) in a worker thread without awaiting it."""
+    task = asyncio.create_task(asyncio.to_thread(func, *args, **kwargs), name=func.__name__)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_background_done)
 
 
-def collect_and_aggregate():
-    """Gather events for the window and return aggregated snapshot."""
-    global _event_buffer
-    now = time.time()
-    cutoff = now - AGGREGATION_WINDOW_SEC
-    _event_buffer = [e for e in _event_buffer if e.get("ts", 0) >= cutoff]
-    return aggregate_last_60_seconds(_event_buffer)
+def _on_background_done(task):
+    """Drop the finished task and surface any error it raised."""
+    _background_tasks.discard(task)
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        log.error("Background %s failed", task.get_name(), exc_info=exc)
 
 
 def run_action(action_key: str, result: dict):
@@ -42,20 +64,21 @@ def run_action(action_key: str, result: dict):
     # no_action: do nothing
 
 
-def main():
+async def main():
     print("\n[Payment operations agent started - 24/7 senior ops manager mode]\n")
     cycle = 0
     total_volume = 0
 
     while True:
         cycle += 1
+        now = time.time()
         # Simulate incoming events (in production, these come from live stream)
+        # 8 events per tick: below the size where the NumPy batch generator pays off
         for _ in range(8):
-            evt = generate_transaction()
-            _event_buffer.append(evt)
+            _aggregator.add(generate_transaction(now))
             total_volume += 1
 
-        aggregated = collect_and_aggregate()
+        aggregated = collect_and_aggregate(now)
         historical = get_historical_outcomes(5)
 
         result = diagnose_and_decide(aggregated, historical)
@@ -76,33 +99,39 @@ def main():
         }
         remember(incident)
 
-        if should_escalate(result):
-            alert_ops(
+        decision = evaluate(result, total_volume)
+        if decision is GuardrailDecision.ESCALATE:
+            _fire_and_forget(
+                alert_ops,
                 f"Confidence {result['confidence_score']} < 0.8 — human approval required. "
                 f"Proposed: {result['proposed_action']}"
             )
-            store_lesson(
+            _fire_and_forget(
+                store_lesson,
                 result["diagnosis"],
                 "ALERT_ONLY",
                 "ESCALATED",
                 metadata={"proposed_action": result["proposed_action"], "confidence": result["confidence_score"]},
             )
-        elif action_key != "no_action" and is_safe(result["confidence_score"], total_volume):
+        elif action_key == "no_action":
+            _fire_and_forget(store_lesson, result["diagnosis"], "Take no action", "MONITORED", {})
+        elif decision is GuardrailDecision.EXECUTE:
             run_action(action_key, result)
-            store_lesson(
+            _fire_and_forget(
+                store_lesson,
                 result["diagnosis"],
                 result["proposed_action"],
                 "EXECUTED",
                 metadata={"action_key": action_key},
             )
-        elif action_key != "no_action":
-            alert_ops("Action skipped: volume or safety limit exceeded.")
-            store_lesson(result["diagnosis"], result["proposed_action"], "SKIPPED_SAFETY", {})
         else:
-            store_lesson(result["diagnosis"], "Take no action", "MONITORED", {})
+            _fire_and_forget(alert_ops, "Action skipped: volume or safety limit exceeded.")
+            _fire_and_forget(store_lesson, result["diagnosis"], result["proposed_action"], "SKIPPED_SAFETY", {})
 
-        time.sleep(TICK_SEC)
+        await asyncio.sleep(TICK_SEC)
 
 
 if __name__ == "__main__":
-    main()
+    # Tool actions and ops alerts are emitted through logging
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    asyncio.run(main())
@@ -1,9 +1,16 @@
 import json
+import logging
 import os
+import threading
 import time
+from collections import deque
+from itertools import islice
 
-_DEFAULT_PATH = os.path.join(os.path.dirname(__file__), "lessons.json")
+_DEFAULT_PATH = os.path.join(os.path.dirname(__file__), "lessons.jsonl")
 _store = None
+log = logging.getLogger(__name__)
+# Lessons kept in memory for retrieval; the full history stays on disk
+MAX_RECENT_LESSONS = 1000
 
 
 def _get_store():
@@ -14,21 +21,41 @@ def _get_store():
 
 
 class LongTermMemory:
+    """Recent lessons kept in memory; every lesson is appended to a JSON Lines file."""
+
     def __init__(self, path=None):
         self.path = path or _DEFAULT_PATH
+        self.recent = deque(maxlen=MAX_RECENT_LESSONS)
+        # save_lesson may run in a worker thread while retrieve iterates recent
+        self._lock = threading.Lock()
+        # A crash mid-append can leave a partial last line without "\n"
+        self._needs_newline = False
         try:
             with open(self.path) as f:
-                self.data = json.load(f)
-        except Exception:
-            self.data = []
+                for lineno, line in enumerate(f, 1):
+                    self._needs_newline = not line.endswith("\n")
+                    if not line.strip():
+                        continue
+                    try:
+                        self.recent.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        log.warning("Skipping unreadable lesson at %s:%d", self.path, lineno)
+        except FileNotFoundError:
+            pass
 
     def save_lesson(self, lesson):
-        self.data.append(lesson)
-        with open(self.path, "w") as f:
-            json.dump(self.data, f, indent=2)
+        record = json.dumps(lesson, separators=(",", ":")) + "\n"
+        with self._lock:
+            self.recent.append(lesson)
+            if self._needs_newline:
+                record = "\n" + record
+                self._needs_newline = False
+            with open(self.path, "a") as f:
+                f.write(record)
 
     def retrieve(self, n=5):
-        return self.data[-n:]
+        with self._lock:
+            return list(islice(reversed(self.recent), n))[::-1]
 
 
 def store_lesson(diagnosis: str, action: str, outcome: str, metadata: dict = None):
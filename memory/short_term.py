@@ -1,4 +1,5 @@
 from collections import deque
+from itertools import islice
 
 _buffer = deque(maxlen=200)
 
@@ -10,7 +11,7 @@ def remember(incident: dict):
 
 def get_recent(n=50):
     """Return last n incidents from short-term buffer."""
-    return list(_buffer)[-n:]
+    return list(islice(reversed(_buffer), n))[::-1]
 
 
 class ShortTermMemory:
@@ -1,16 +1,43 @@
-from collections import Counter
 from config import FAILURE_THRESHOLD
 
 def summarize(window):
-    failures = [e for e in window if e["status"] == "FAILED"]
-    by_bank = Counter(e["bank"] for e in failures)
-    by_error = Counter(e["error_code"] for e in failures)
+    # One pass over the window; only failures are counted by bank/error, and the
+    # dominant bank/error are tracked as the counts grow so reason() needs no re-scan.
+    # Ties go to the key seen first, matching max(d, key=d.get) over insertion order.
+    failure_count = 0
+    by_bank = {}
+    by_error = {}
+    bank_seen = {}
+    error_seen = {}
+    dominant_bank, dominant_bank_count = None, 0
+    dominant_error, dominant_error_count = None, 0
+    for e in window:
+        if e["status"] == "FAILED":
+            failure_count += 1
+            bank = e["bank"]
+            n = by_bank[bank] = by_bank.get(bank, 0) + 1
+            if n == 1:
+                bank_seen[bank] = len(bank_seen)
+            if n > dominant_bank_count or (
+                n == dominant_bank_count and bank_seen[bank] < bank_seen[dominant_bank]
+            ):
+                dominant_bank, dominant_bank_count = bank, n
+            error_code = e["error_code"]
+            n = by_error[error_code] = by_error.get(error_code, 0) + 1
+            if n == 1:
+                error_seen[error_code] = len(error_seen)
+            if n > dominant_error_count or (
+                n == dominant_error_count and error_seen[error_code] < error_seen[dominant_error]
+            ):
+                dominant_error, dominant_error_count = error_code, n
 
     return {
         "total_events": len(window),
-        "failure_count": len(failures),
-        "failures_by_bank": dict(by_bank),
-        "errors": dict(by_error)
+        "failure_count": failure_count,
+        "failures_by_bank": by_bank,
+        "errors": by_error,
+        "dominant_bank": dominant_bank,
+        "dominant_error": dominant_error
     }
 
 def reason(summary):
@@ -20,8 +47,8 @@ def reason(summary):
             "confidence": 0.3
         }
 
-    dominant_bank = max(summary["failures_by_bank"], key=summary["failures_by_bank"].get)
-    dominant_error = max(summary["errors"], key=summary["errors"].get)
+    dominant_bank = summary["dominant_bank"]
+    dominant_error = summary["dominant_error"]
 
     if dominant_error == "ISSUER_TIMEOUT":
         return {
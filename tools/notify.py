@@ -1,13 +1,18 @@
 """
 Alerts and notifications to human operators.
 """
+import logging
+
+log = logging.getLogger(__name__)
+
+
 def alert_ops(message: str, severity: str = "warning"):
     """
     Send alert to human operators. Use when confidence is low or escalation is required.
     """
-    prefix = "ALERT OPS"
     if severity == "critical":
-        prefix = "CRITICAL"
+        log.critical("[CRITICAL]: %s", message)
     elif severity == "info":
-        prefix = "OPS"
-    print(f"[{prefix}]: {message}")
+        log.info("[OPS]: %s", message)
+    else:
+        log.warning("[ALERT OPS]: %s", message)
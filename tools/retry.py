@@ -1,6 +1,11 @@
 """
 Retry policy adjustments for payment operations.
 """
+import logging
+
+log = logging.getLogger(__name__)
+
+
 def adjust_retry_policy(
     max_retries: int = None,
     backoff_seconds: float = None,
@@ -10,12 +15,14 @@ def adjust_retry_policy(
     Adjust retry policy (e.g. reduce retries or increase backoff) to avoid retry storms.
     Reversible via config.
     """
-    parts = ["Adjusting retry policy"]
-    if max_retries is not None:
-        parts.append(f"max_retries={max_retries}")
-    if backoff_seconds is not None:
-        parts.append(f"backoff={backoff_seconds}s")
-    msg = " — ".join(parts)
-    if reason:
-        msg += f" — {reason}"
-    print(f"[ACTION] {msg}")
+    # Message is only built when INFO is enabled; the action itself always runs
+    if log.isEnabledFor(logging.INFO):
+        parts = ["Adjusting retry policy"]
+        if max_retries is not None:
+            parts.append(f"max_retries={max_retries}")
+        if backoff_seconds is not None:
+            parts.append(f"backoff={backoff_seconds}s")
+        msg = " — ".join(parts)
+        if reason:
+            msg += f" — {reason}"
+        log.info("[ACTION] %s", msg)
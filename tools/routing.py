@@ -1,18 +1,22 @@
 """
 Rerouting and path-suppression logic for payment traffic.
 """
+import logging
+
 from config import WINDOW_SIZE  # optional; use if needed
 
+log = logging.getLogger(__name__)
+
 
 def reroute_traffic(percent: float = 30, reason: str = ""):
     """
     Reroute a percentage of traffic to backup PSP/acquirer.
     Reversible; low risk when percent is moderate.
     """
-    msg = f"Rerouting {percent}% of traffic to backup PSP"
     if reason:
-        msg += f" — {reason}"
-    print(f"[ACTION] {msg}")
+        log.info("[ACTION] Rerouting %s%% of traffic to backup PSP — %s", percent, reason)
+    else:
+        log.info("[ACTION] Rerouting %s%% of traffic to backup PSP", percent)
 
 
 def suppress_failing_path(bank_or_issuer: str = None, reason: str = ""):
@@ -21,7 +25,7 @@ def suppress_failing_path(bank_or_issuer: str = None, reason: str = ""):
     Should be reversible via config/feature flag.
     """
     target = bank_or_issuer or "affected path"
-    msg = f"Suppressing failing path: {target}"
     if reason:
-        msg += f" — {reason}"
-    print(f"[ACTION] Suppress: {msg}")
+        log.info("[ACTION] Suppress: Suppressing failing path: %s — %s", target, reason)
+    else:
+        log.info("[ACTION] Suppress: Suppressing failing path: %s", target)